@@ -1,10 +1,12 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import json
 import os
-import base64
 import traceback
 
+# Keep module import light for serverless cold starts: corpus and scraper are
+# only imported by the code paths that need them, and scraped data is only
+# loaded on the first question.
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
@@ -63,36 +65,56 @@ EMBEDDED_DISCOURSE_POSTS = [
     }
 ]
 
-def load_scraped_data():
-    """Load scraped course content and discourse posts"""
-    course_content = []
-    discourse_posts = []
+_scraped_data = None
+
+def get_scraped_data():
+    """Return scraped data as Corpus objects, loading it once on first use"""
+    global _scraped_data
+    if _scraped_data is None:
+        _scraped_data = (
+            load_corpus('course_content', EMBEDDED_COURSE_CONTENT),
+            load_corpus('discourse_posts', EMBEDDED_DISCOURSE_POSTS)
+        )
+    return _scraped_data
+
+def load_corpus(name, embedded_data):
+    """Load data/<name> from its .corpus file, its JSON file or the embedded data"""
+    from corpus import Corpus, iter_json_array
+
+    corpus = open_corpus_file(name)
+    if corpus is not None:
+        return corpus
     
+    json_path = f'data/{name}.json'
     try:
-        # Try to load from files first (for local development)
-        if os.path.exists('data/course_content.json'):
-            with open('data/course_content.json', 'r', encoding='utf-8') as f:
-                course_content = json.load(f)
-        else:
-            # Use embedded data for production
-            course_content = EMBEDDED_COURSE_CONTENT
+        # Try to load from files first (for local development), streaming
+        # items so the parsed dicts are never all held at once
+        if os.path.exists(json_path):
+            return Corpus(iter_json_array(json_path))
     except Exception as e:
-        print(f"Error loading course content: {e}")
-        course_content = EMBEDDED_COURSE_CONTENT
+        print(f"Error loading {json_path}: {e}")
     
+    # Use embedded data for production
+    return Corpus(embedded_data)
+
+def open_corpus_file(name):
+    """Open data/<name>.corpus if it is usable and at least as new as data/<name>.json"""
+    from corpus import Corpus
+
+    # Prebuilt corpus files (written by scraper.py) are mmap'd read-only,
+    # so all gunicorn workers share one copy through the page cache
+    corpus_path = f'data/{name}.corpus'
+    json_path = f'data/{name}.json'
+    if not (os.path.exists(corpus_path) and os.path.exists(json_path)):
+        return None
+    if os.path.getmtime(corpus_path) < os.path.getmtime(json_path):
+        print(f"Ignoring {corpus_path}: older than {json_path}")
+        return None
     try:
-        # Try to load from files first (for local development)
-        if os.path.exists('data/discourse_posts.json'):
-            with open('data/discourse_posts.json', 'r', encoding='utf-8') as f:
-                discourse_posts = json.load(f)
-        else:
-            # Use embedded data for production
-            discourse_posts = EMBEDDED_DISCOURSE_POSTS
+        return Corpus.open(corpus_path)
     except Exception as e:
-        print(f"Error loading discourse posts: {e}")
-        discourse_posts = EMBEDDED_DISCOURSE_POSTS
-    
-    return course_content, discourse_posts
+        print(f"Error opening {corpus_path}: {e}")
+        return None
 
 def process_image(base64_image):
     """Process base64 encoded image - placeholder for image analysis"""
@@ -107,7 +129,7 @@ def process_image(base64_image):
 def generate_answer(question, image_data=None):
     """Generate answer based on question and available data"""
     try:
-        course_content, discourse_posts = load_scraped_data()
+        course_content, discourse_posts = get_scraped_data()
         
         # Process image if provided
         image_info = ""
@@ -174,25 +196,25 @@ def generate_answer(question, image_data=None):
             answer_parts = []
             relevant_links = []
             
+            search_words = [word for word in question_lower.split() if len(word) > 3]
+            
             # Search discourse posts
-            for post in discourse_posts:
-                post_text = (post.get('title', '') + ' ' + post.get('content', '')).lower()
-                if any(word in post_text for word in question_lower.split() if len(word) > 3):
-                    relevant_links.append({
-                        "url": post.get('url', ''),
-                        "text": post.get('title', 'Relevant discussion')
-                    })
-                    if post.get('content'):
-                        answer_parts.append(post.get('content', '')[:200])
+            for index in discourse_posts.search(search_words):
+                post = discourse_posts[index]
+                relevant_links.append({
+                    "url": post.get('url', ''),
+                    "text": post.get('title', 'Relevant discussion')
+                })
+                if post.get('content'):
+                    answer_parts.append(post.get('content', '')[:200])
             
             # Search course content
-            for content in course_content:
-                content_text = (content.get('title', '') + ' ' + content.get('content', '')).lower()
-                if any(word in content_text for word in question_lower.split() if len(word) > 3):
-                    relevant_links.append({
-                        "url": content.get('url', ''),
-                        "text": content.get('title', 'Course content')
-                    })
+            for index in course_content.search(search_words):
+                content = course_content[index]
+                relevant_links.append({
+                    "url": content.get('url', ''),
+                    "text": content.get('title', 'Course content')
+                })
             
             if answer_parts:
                 answer = f"Based on available information: {answer_parts[0][:150]}..."
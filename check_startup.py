@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Cold-start import check for TDS Virtual TA
+
+Imports app.py in a fresh interpreter with `-X importtime`, hits /health,
+and fails if the import budget is exceeded or a heavy module got pulled in.
+"""
+import os
+import subprocess
+import sys
+
+# Budget for app's own import time in milliseconds, i.e. `import app` minus
+# the framework below. Measured at 3-8 ms; the margin absorbs noise but not
+# a new heavy import.
+DEFAULT_BUDGET_MS = 12
+
+# Framework imports app.py always needs; their time is reported, not budgeted
+FRAMEWORK_MODULES = ["flask", "flask_cors"]
+
+# Modules that must never be imported just to start the server or answer /health
+FORBIDDEN_MODULES = ["requests", "PIL", "numpy", "scraper", "corpus"]
+
+STARTUP_CODE = "import app; app.app.test_client().get('/health')"
+
+def run_importtime():
+    """Run the startup code with -X importtime and return its stderr lines"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_CODE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        raise RuntimeError("Importing app failed")
+    return result.stderr.splitlines()
+
+def parse_importtime(lines):
+    """Parse importtime output into {module: cumulative_microseconds}"""
+    modules = {}
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue  # header line
+        modules[parts[2].strip()] = cumulative
+    return modules
+
+def check_startup(budget_ms=DEFAULT_BUDGET_MS):
+    """Return True if app startup stays within budget and avoids heavy modules"""
+    modules = parse_importtime(run_importtime())
+    ok = True
+
+    total_ms = modules.get("app", 0) / 1000
+    framework_ms = sum(modules.get(name, 0) for name in FRAMEWORK_MODULES) / 1000
+    app_ms = total_ms - framework_ms
+    print(f"import app: {total_ms:.1f} ms total, {framework_ms:.1f} ms in {', '.join(FRAMEWORK_MODULES)}")
+    if app_ms <= budget_ms:
+        print(f"✅ app's own imports: {app_ms:.1f} ms (budget {budget_ms} ms)")
+    else:
+        print(f"❌ app's own imports: {app_ms:.1f} ms exceeds budget of {budget_ms} ms")
+        ok = False
+
+    for name in FORBIDDEN_MODULES:
+        loaded = [m for m in modules if m == name or m.startswith(name + ".")]
+        if loaded:
+            print(f"❌ {name} imported at startup ({len(loaded)} modules)")
+            ok = False
+        else:
+            print(f"✅ {name} not imported")
+
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:5]
+    print("Slowest imports (cumulative):")
+    for name, micros in slowest:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+
+    return ok
+
+if __name__ == "__main__":
+    # Allow overriding the budget from the command line or environment
+    if len(sys.argv) > 1:
+        budget = int(sys.argv[1])
+    else:
+        budget = int(os.environ.get("STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS))
+
+    print("TDS Virtual TA Startup Check")
+    print("=" * 50)
+
+    sys.exit(0 if check_startup(budget) else 1)
@@ -0,0 +1,294 @@
+"""
+Compact columnar storage for scraped documents
+
+Instead of one dict per item, a Corpus keeps every field in a few flat
+buffers: titles, urls and contents are UTF-8 encoded into one byte buffer
+with offsets, dates and tags are integer arrays (dates that are not plain
+YYYY-MM-DD strings are kept verbatim in the text buffer), and the lowercased
+search text is built once at load time. Document is a thin __slots__ view that
+gives the response code the same .get() access it had with dicts.
+
+A Corpus can be saved to a single file and opened again with mmap, so
+every worker process shares one read-only copy through the page cache.
+"""
+from array import array
+from bisect import bisect_right
+import json
+import mmap
+import os
+import re
+import sys
+import tempfile
+
+TEXT_FIELDS = ("title", "url", "content")
+FIELDS = TEXT_FIELDS + ("date", "tags")
+
+# Per-document slots in the text buffer; the date slot holds the raw date
+# string when it cannot be encoded as an integer
+TEXT_SLOTS = TEXT_FIELDS + ("date",)
+
+# Separates documents in the search buffer so a match never spans two of them
+SEPARATOR = b"\x00"
+
+# Corpus file layout: MAGIC, 8-byte little-endian header length, JSON header,
+# then each section padded to an 8-byte boundary
+MAGIC = b"TDSCORPUS1\n"
+ARRAY_SECTIONS = ("_present", "_nulls", "_text_offsets", "_search_offsets", "_dates",
+                  "_tag_offsets", "_tag_ids")
+BYTES_SECTIONS = ("_text", "_search")
+
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+def encode_date(value):
+    """Encode a YYYY-MM-DD date string as an integer like 20250410, or 0 for any other format"""
+    try:
+        year, month, day = value.split("-")
+        encoded = int(year) * 10000 + int(month) * 100 + int(day)
+    except (AttributeError, ValueError):
+        return 0
+    # Only keep the integer form if it decodes back to exactly the same string
+    return encoded if 0 < encoded < 100000000 and decode_date(encoded) == value else 0
+
+def decode_date(value):
+    """Decode an integer date back to its YYYY-MM-DD string"""
+    return f"{value // 10000:04d}-{value // 100 % 100:02d}-{value % 100:02d}"
+
+def current_umask():
+    """Return the process umask (os.umask can only read it by setting it)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+def iter_json_array(path):
+    """Yield the items of a JSON array file one at a time instead of as one list"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    decoder = json.JSONDecoder()
+    position = JSON_WHITESPACE.match(text).end()
+    if text[position:position + 1] != "[":
+        raise ValueError(f"Expected a JSON array in {path}")
+    position = JSON_WHITESPACE.match(text, position + 1).end()
+    if text[position:position + 1] == "]":
+        return
+    while True:
+        item, position = decoder.raw_decode(text, position)
+        yield item
+        position = JSON_WHITESPACE.match(text, position).end()
+        if text[position:position + 1] == "]":
+            return
+        if text[position:position + 1] != ",":
+            raise ValueError(f"Expected ',' or ']' at position {position} in {path}")
+        position = JSON_WHITESPACE.match(text, position + 1).end()
+
+class Document:
+    """Read-only dict-style view of one document in a Corpus"""
+    __slots__ = ("_corpus", "_index")
+
+    def __init__(self, corpus, index):
+        self._corpus = corpus
+        self._index = index
+
+    def get(self, key, default=None):
+        return self._corpus.field(self._index, key, default)
+
+    def __getitem__(self, key):
+        value = self._corpus.field(self._index, key, KeyError)
+        if value is KeyError:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._corpus.has_field(self._index, key)
+
+    def keys(self):
+        return [key for key in FIELDS if key in self]
+
+    def to_dict(self):
+        return {key: self[key] for key in self.keys()}
+
+    def __repr__(self):
+        return f"Document({self.to_dict()!r})"
+
+class Corpus:
+    """Columnar, read-only collection of scraped documents"""
+
+    def __init__(self, documents):
+        # documents can be any iterable, such as iter_json_array(), so the
+        # source dicts never need to be in memory all at once
+        text = bytearray()
+        search = bytearray()
+        self._text_offsets = array("I", [0])
+        self._search_offsets = array("I", [0])
+        self._present = array("B")
+        self._nulls = array("B")
+        self._dates = array("I")
+        self._tag_offsets = array("I", [0])
+        self._tag_ids = array("I")
+        self._tag_names = []
+        tag_lookup = {}
+
+        for doc in documents:
+            present = nulls = 0
+            for bit, key in enumerate(FIELDS):
+                if key in doc:
+                    present |= 1 << bit
+                    if doc[key] is None:
+                        nulls |= 1 << bit
+            self._present.append(present)
+            self._nulls.append(nulls)
+
+            date = doc.get("date")
+            encoded_date = encode_date(date)
+            self._dates.append(encoded_date)
+            raw_date = "" if encoded_date or date is None else str(date)
+
+            for key in TEXT_FIELDS:
+                text += (doc.get(key) or "").encode("utf-8")
+                self._text_offsets.append(len(text))
+            text += raw_date.encode("utf-8")
+            self._text_offsets.append(len(text))
+
+            # Same text the query loop used to build per request
+            search_text = ((doc.get("title") or "") + " " + (doc.get("content") or "")).lower()
+            search += search_text.encode("utf-8") + SEPARATOR
+            self._search_offsets.append(len(search))
+
+            for tag in doc.get("tags") or []:
+                if tag not in tag_lookup:
+                    tag_lookup[tag] = len(self._tag_names)
+                    self._tag_names.append(tag)
+                self._tag_ids.append(tag_lookup[tag])
+            self._tag_offsets.append(len(self._tag_ids))
+
+        # Kept as bytearrays; copying them to bytes would double peak memory
+        self._text = text
+        self._search = search
+        self._search_base = 0
+        self._search_end = len(self._search)
+
+    def save(self, path):
+        """Write the corpus to a file that Corpus.open() can mmap"""
+        sections = {}
+        position = 0
+        for name in ARRAY_SECTIONS + BYTES_SECTIONS:
+            buffer = getattr(self, name)
+            typecode = buffer.typecode if name in ARRAY_SECTIONS else "B"
+            length = len(memoryview(buffer).cast("B"))
+            sections[name] = [position, length, typecode]
+            position += length + (-length % 8)
+
+        header = json.dumps({
+            "byteorder": sys.byteorder,
+            "itemsize": {code: array(code).itemsize for code in "BI"},
+            "tag_names": self._tag_names,
+            "sections": sections
+        }).encode("utf-8")
+        start = len(MAGIC) + 8 + len(header)
+        padding = -start % 8
+
+        # Write to a temporary file and swap it in, so processes that have the
+        # old file mmap'd keep reading it instead of hitting truncated pages
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write((len(header) + padding).to_bytes(8, "little"))
+                f.write(header + b" " * padding)
+                for name in ARRAY_SECTIONS + BYTES_SECTIONS:
+                    data = memoryview(getattr(self, name)).cast("B")
+                    f.write(data)
+                    f.write(b"\x00" * (-len(data) % 8))
+            # mkstemp creates the file as 0600; give it the mode open() would
+            os.chmod(tmp_path, 0o666 & ~current_umask())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def open(cls, path):
+        """Open a saved corpus read-only, backed by mmap instead of process memory"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if mapped[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"Not a corpus file: {path}")
+            header_start = len(MAGIC) + 8
+            header_length = int.from_bytes(mapped[len(MAGIC):header_start], "little")
+            header = json.loads(mapped[header_start:header_start + header_length])
+            itemsize = {code: array(code).itemsize for code in "BI"}
+            if header["byteorder"] != sys.byteorder or header["itemsize"] != itemsize:
+                raise ValueError(f"Corpus file was built on an incompatible platform: {path}")
+            data_start = header_start + header_length
+            if set(header["sections"]) != set(ARRAY_SECTIONS + BYTES_SECTIONS):
+                raise ValueError(f"Corpus file has unexpected sections: {path}")
+            for offset, length, typecode in header["sections"].values():
+                if data_start + offset + length > len(mapped) or length % array(typecode).itemsize:
+                    raise ValueError(f"Corpus file is truncated or corrupt: {path}")
+        except Exception:
+            mapped.close()
+            raise
+
+        corpus = cls.__new__(cls)
+        corpus._mmap = mapped
+        corpus._tag_names = header["tag_names"]
+        view = memoryview(mapped)
+        for name, (offset, length, typecode) in header["sections"].items():
+            start = data_start + offset
+            setattr(corpus, name, view[start:start + length].cast(typecode))
+
+        # Search with mmap.find() directly, bounded to the search section
+        offset, length, _ = header["sections"]["_search"]
+        corpus._search = mapped
+        corpus._search_base = data_start + offset
+        corpus._search_end = corpus._search_base + length
+        return corpus
+
+    def __len__(self):
+        return len(self._present)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Corpus index out of range")
+        return Document(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield Document(self, index)
+
+    def has_field(self, index, key):
+        return key in FIELDS and bool(self._present[index] >> FIELDS.index(key) & 1)
+
+    def field(self, index, key, default=None):
+        """Return one field of a document, or default if it is missing"""
+        if not self.has_field(index, key):
+            return default
+        if self._nulls[index] >> FIELDS.index(key) & 1:
+            return None
+        if key == "date" and self._dates[index]:
+            return decode_date(self._dates[index])
+        if key in TEXT_SLOTS:
+            slot = index * len(TEXT_SLOTS) + TEXT_SLOTS.index(key)
+            start, end = self._text_offsets[slot], self._text_offsets[slot + 1]
+            return str(self._text[start:end], "utf-8")
+        start, end = self._tag_offsets[index], self._tag_offsets[index + 1]
+        return [self._tag_names[tag_id] for tag_id in self._tag_ids[start:end]]
+
+    def search(self, words):
+        """Return indices of documents whose title or content contains any word"""
+        hits = set()
+        for word in words:
+            needle = word.encode("utf-8")
+            if not needle or SEPARATOR in needle:
+                continue
+            base, end = self._search_base, self._search_end
+            position = self._search.find(needle, base, end)
+            while position != -1:
+                index = bisect_right(self._search_offsets, position - base) - 1
+                hits.add(index)
+                # One hit per document is enough, jump to the next one
+                position = self._search.find(needle, base + self._search_offsets[index + 1], end)
+        return sorted(hits)
@@ -0,0 +1,15 @@
+# Gunicorn settings for running the API with multiple workers:
+#   gunicorn -c gunicorn.conf.py app:app
+
+bind = "0.0.0.0:5000"
+workers = 4
+
+# Import the app once in the master instead of in every worker
+preload_app = True
+
+def when_ready(server):
+    # Runs in the master after the preload and before workers are forked.
+    # The point is to load the scraped data early, so every worker inherits
+    # the same corpus; app is already in sys.modules, nothing is re-imported.
+    from app import get_scraped_data
+    get_scraped_data()
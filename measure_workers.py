@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Memory check for running TDS Virtual TA under gunicorn (Linux only)
+
+Generates a synthetic Discourse corpus in a temporary directory, starts
+gunicorn with 1 and 8 workers for each way of loading the data, and
+prints the total PSS (proportional set size) of master + workers, read
+from /proc/<pid>/smaps_rollup. These are the figures in the README.
+
+Usage: python measure_workers.py [documents] [workers ...]
+"""
+import json
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+from corpus import Corpus, iter_json_array
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def workers_label(workers):
+    """Format a worker count for the output table"""
+    return f"{workers} worker" + ("s" if workers != 1 else "")
+
+# How each mode loads data in a worker; dicts is the app before Corpus
+MODES = {
+    "dicts": "JSON dicts loaded in each worker",
+    "json": "JSON, Corpus built in each worker",
+    "preload": "JSON, Corpus built in master (preload)",
+    "mmap": "mmap'd .corpus files",
+}
+
+GUNICORN_CONF = """
+import os, sys
+sys.path.insert(0, {repo_dir!r})
+bind = "127.0.0.1:0"
+workers = {workers}
+preload_app = True
+
+def when_ready(server):
+    if {mode!r} == "preload":
+        from app import get_scraped_data
+        get_scraped_data()
+
+def post_worker_init(worker):
+    if {mode!r} == "dicts":
+        import json
+        with open("data/discourse_posts.json", encoding="utf-8") as f:
+            worker.posts = json.load(f)
+    else:
+        from app import get_scraped_data
+        posts = get_scraped_data()[1]
+        # Touch every page, as a real workload eventually would
+        posts.search(["no-such-word"])
+        for post in posts:
+            post.get("content")
+    open(f"ready.{{os.getpid()}}", "w").close()
+"""
+
+def generate_posts(count, seed=0):
+    """Build synthetic Discourse posts of roughly real size"""
+    rng = random.Random(seed)
+    words = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 10)))
+             for _ in range(20000)]
+    return [
+        {
+            "title": " ".join(rng.choices(words, k=6)).capitalize(),
+            "url": f"https://discourse.onlinedegree.iitm.ac.in/t/post/{i}",
+            "content": " ".join(rng.choices(words, k=120)),
+            "date": "2025-04-%02d" % rng.randint(1, 28),
+            "tags": rng.sample(words[:200], 3)
+        }
+        for i in range(count)
+    ]
+
+def total_pss_mb(master_pid):
+    """Sum PSS of the gunicorn master and its workers"""
+    children = subprocess.run(
+        ["pgrep", "-P", str(master_pid)], capture_output=True, text=True
+    ).stdout.split()
+    total_kb = 0
+    for pid in [str(master_pid)] + children:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    total_kb += int(line.split()[1])
+    return total_kb / 1024
+
+def measure(workdir, mode, workers):
+    """Start gunicorn in workdir, wait for all workers to load data, return PSS in MB"""
+    for name in os.listdir(workdir):
+        if name.startswith("ready."):
+            os.remove(os.path.join(workdir, name))
+    with open(os.path.join(workdir, "gunicorn_measure.py"), "w") as f:
+        f.write(GUNICORN_CONF.format(repo_dir=REPO_DIR, workers=workers, mode=mode))
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn_measure.py", "app:app"],
+        cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.time() + 300
+        while sum(name.startswith("ready.") for name in os.listdir(workdir)) < workers:
+            if time.time() > deadline or server.poll() is not None:
+                raise RuntimeError(f"gunicorn did not start in mode {mode}")
+            time.sleep(0.5)
+        time.sleep(2)
+        return total_pss_mb(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or [1, 8]
+
+    print("TDS Virtual TA Worker Memory Check")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp()
+    try:
+        data_dir = os.path.join(workdir, "data")
+        os.makedirs(data_dir)
+        posts = generate_posts(count)
+        with open(os.path.join(data_dir, "discourse_posts.json"), "w", encoding="utf-8") as f:
+            json.dump(posts, f)
+        del posts
+        shutil.copy(os.path.join(REPO_DIR, "data", "course_content.json"), data_dir)
+        json_mb = os.path.getsize(os.path.join(data_dir, "discourse_posts.json")) / 1e6
+        print(f"{count} synthetic posts, {json_mb:.0f} MB of JSON")
+
+        results = {}
+        for mode in MODES:
+            if mode == "mmap":
+                for name in ("course_content", "discourse_posts"):
+                    corpus = Corpus(iter_json_array(os.path.join(data_dir, f"{name}.json")))
+                    corpus.save(os.path.join(data_dir, f"{name}.corpus"))
+            results[mode] = [measure(workdir, mode, workers) for workers in worker_counts]
+            print(f"  {MODES[mode]}: " + ", ".join(
+                f"{workers_label(workers)} {mb:.0f} MB" for workers, mb in zip(worker_counts, results[mode])))
+    finally:
+        shutil.rmtree(workdir)
+
+    print()
+    print("| Data loading | " + " | ".join(workers_label(workers) for workers in worker_counts) + " |")
+    print("|---|" + "---:|" * len(worker_counts))
+    for mode, figures in results.items():
+        print(f"| {MODES[mode]} | " + " | ".join(f"{mb:.0f} MB" for mb in figures) + " |")
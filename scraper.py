@@ -1,9 +1,7 @@
-import requests
 import json
 import os
-from datetime import datetime
-import time
-import re
+
+from corpus import Corpus
 
 def scrape_content(question):
     """
@@ -223,7 +221,8 @@ def scrape_discourse_date_range(start_date, end_date, category="tds"):
         "username": "YOUR_USERNAME"
     }
     
-    # In a real implementation, you would:
+    # In a real implementation, you would (importing `requests` here, not at
+    # module level, so the API server never pays for it):
     # 1. Use the Discourse API to fetch posts
     # 2. Filter by date range
     # 3. Extract relevant content
@@ -241,6 +240,8 @@ def scrape_discourse_date_range(start_date, end_date, category="tds"):
 
 def main():
     """Main scraping function"""
+    from datetime import datetime
+
     # Create data directory
     os.makedirs('data', exist_ok=True)
     
@@ -266,6 +267,10 @@ def main():
     with open('data/combined_data.json', 'w', encoding='utf-8') as f:
         json.dump(combined_data, f, indent=2, ensure_ascii=False)
     
+    # Build read-only corpus files that app.py mmaps instead of parsing JSON
+    Corpus(course_content).save('data/course_content.corpus')
+    Corpus(discourse_posts).save('data/discourse_posts.corpus')
+    
     print("Data scraping completed successfully!")
     print(f"Course content: {len(course_content)} items")
     print(f"Discourse posts: {len(discourse_posts)} items")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar Corpus
+
+Run with: python -m unittest test_corpus
+"""
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from corpus import Corpus, iter_json_array
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+VOCABULARY = ("python setup İstanbul ÄPI gpt-3.5 turbo café ÉCOLE data science "
+              "guidelines environment copilot ß straße").split()
+
+def old_search(docs, question):
+    """The per-dict search loop app.py used before Corpus"""
+    words = [word for word in question.lower().split() if len(word) > 3]
+    return [
+        index for index, doc in enumerate(docs)
+        if any(word in (doc.get('title', '') + ' ' + doc.get('content', '')).lower() for word in words)
+    ]
+
+def random_docs(count, seed=0):
+    rng = random.Random(seed)
+    with open(os.path.join(DATA_DIR, "discourse_posts.json"), encoding="utf-8") as f:
+        docs = json.load(f)
+    for _ in range(count):
+        docs.append({
+            "title": " ".join(rng.choices(VOCABULARY, k=3)),
+            "url": "https://discourse.onlinedegree.iitm.ac.in/t/post",
+            "content": " ".join(rng.choices(VOCABULARY, k=20)),
+            "date": "2025-%02d-%02d" % (rng.randint(1, 12), rng.randint(1, 28)),
+            "tags": rng.sample(VOCABULARY, 3)
+        })
+    return docs
+
+def random_questions(count, seed=1):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(VOCABULARY + ["ata sci", "x"], k=3)) for _ in range(count)]
+
+class CorpusSearchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.docs = random_docs(500)
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(cls.tmpdir.name, "posts.corpus")
+        Corpus(cls.docs).save(path)
+        cls.corpora = {"memory": Corpus(cls.docs), "mmap": Corpus.open(path)}
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.corpora
+        cls.tmpdir.cleanup()
+
+    def test_documents_match_dicts(self):
+        for kind, corpus in self.corpora.items():
+            with self.subTest(kind):
+                self.assertEqual(len(corpus), len(self.docs))
+                self.assertEqual([doc.to_dict() for doc in corpus], self.docs)
+
+    def test_search_matches_old_loop(self):
+        for kind, corpus in self.corpora.items():
+            for question in random_questions(300):
+                with self.subTest(kind, question=question):
+                    words = [word for word in question.lower().split() if len(word) > 3]
+                    self.assertEqual(corpus.search(words), old_search(self.docs, question))
+
+    def test_empty_corpus(self):
+        path = os.path.join(self.tmpdir.name, "empty.corpus")
+        Corpus([]).save(path)
+        for corpus in (Corpus([]), Corpus.open(path)):
+            self.assertEqual(len(corpus), 0)
+            self.assertEqual(list(corpus), [])
+            self.assertEqual(corpus.search(["python"]), [])
+            with self.assertRaises(IndexError):
+                corpus[0]
+
+class CorpusDateTest(unittest.TestCase):
+    def test_unparseable_dates_are_kept_verbatim(self):
+        dates = ["2025-04-10", "2025-04-10T10:00:00.000Z", "10/04/2025",
+                 "2025-4-1", "0000-00-00", "99999999-01-01", "", None]
+        docs = [{"title": "Pandas dataframe help", "content": "", "date": date} for date in dates]
+        corpus = Corpus(docs)
+        self.assertEqual([doc.get("date") for doc in corpus], dates)
+        self.assertEqual(corpus.search(["pandas"]), list(range(len(dates))))
+
+class CorpusFieldTest(unittest.TestCase):
+    def test_missing_and_none_fields(self):
+        docs = [
+            {"title": "only title"},
+            {"title": None, "url": None, "content": None, "date": None, "tags": None},
+            {}
+        ]
+        corpus = Corpus(docs)
+        for doc, view in zip(docs, corpus):
+            self.assertEqual(view.to_dict(), doc)
+            self.assertEqual(view.get("content", "fallback"), doc.get("content", "fallback"))
+        self.assertNotIn("url", corpus[0])
+        self.assertIsNone(corpus[1]["title"])
+        with self.assertRaises(KeyError):
+            corpus[2]["title"]
+        self.assertEqual(corpus.search(["title"]), [0])
+
+    def test_none_fields_survive_save_and_open(self):
+        docs = [{"title": None, "content": "x", "date": "10/04/2025", "tags": ["a", "b"]}, {}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "posts.corpus")
+            Corpus(docs).save(path)
+            self.assertEqual([doc.to_dict() for doc in Corpus.open(path)], docs)
+
+class CorpusFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "posts.corpus")
+        Corpus([{"title": "GA5 clarification", "date": "2025-04-10"}]).save(self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_truncated_file_is_rejected(self):
+        for size in (0, 40, os.path.getsize(self.path) - 8):
+            with open(self.path, "r+b") as f:
+                f.truncate(size)
+            with self.assertRaises(ValueError):
+                Corpus.open(self.path)
+
+    def test_save_keeps_open_corpus_readable(self):
+        opened = Corpus.open(self.path)
+        Corpus([{"title": "replacement"}] * 1000).save(self.path)
+        self.assertEqual(opened[0].get("title"), "GA5 clarification")
+        self.assertEqual(len(Corpus.open(self.path)), 1000)
+        self.assertEqual(os.listdir(self.tmpdir.name), ["posts.corpus"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX file modes only")
+    def test_saved_file_gets_default_mode(self):
+        for umask in (0o022, 0o002):
+            old_umask = os.umask(umask)
+            try:
+                Corpus([]).save(self.path)
+            finally:
+                os.umask(old_umask)
+            self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o666 & ~umask)
+
+    def test_other_file_is_rejected(self):
+        with open(self.path, "wb") as f:
+            f.write(b"[]" * 64)
+        with self.assertRaises(ValueError):
+            Corpus.open(self.path)
+
+class IterJsonArrayTest(unittest.TestCase):
+    def read(self, text):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "posts.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            return list(iter_json_array(path))
+
+    def test_matches_json_load(self):
+        with open(os.path.join(DATA_DIR, "discourse_posts.json"), encoding="utf-8") as f:
+            text = f.read()
+        self.assertEqual(self.read(text), json.loads(text))
+        self.assertEqual(self.read(' \n[ {"a": [1, 2]} ,\t"x" ]\n'), [{"a": [1, 2]}, "x"])
+        self.assertEqual(self.read("[ ]"), [])
+
+    def test_rejects_non_arrays(self):
+        for text in ('{"course_content": []}', '[{"a": 1} {"b": 2}]', "[1, 2"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                self.read(text)
+
+if __name__ == "__main__":
+    unittest.main()